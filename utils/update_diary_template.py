@@ -17,19 +17,193 @@ import os
 import re
 import yaml
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Precompiled patterns, shared by every converted file
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+# Asset references are matched on the raw bytes so the file is never fully decoded
+_ASSET_RE = re.compile(
+    rb"\\includegraphics(?:\[[^\]]*\])?\{(?P<g>[^}]+)\}"
+    rb"|\\input\{(?P<i>[^}]*\.(?:png|jpg|jpeg|pdf|eps|svg))\}"
+    rb"|\\epsfig\{file=(?P<e>[^,}]+)"
+    rb"|\\psfig\{file=(?P<p>[^,}]+)"
+)
+# Literal prefixes of _ASSET_RE; a file without any of them has no assets
+_ASSET_MARKERS = (b"\\includegraphics", b"\\input{", b"\\epsfig", b"\\psfig")
+_PLACEHOLDER_RE = re.compile(
+    r"<(?:YEAR|MONTH|DAY|MONTH_NAME|DAY_NUMBER|AUTHOR|INSTITUTION|DIARY_TITLE"
+    r"|FILENAME|TAGS)>"
+)
+
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Buffer size for .tex reads, large enough to cover a whole entry
+_IO_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _today() -> datetime:
+    """Date used for undated files, fixed for the whole run"""
+    return datetime.now()
+
+
+def _decode_tex(data: bytes) -> str:
+    """Decode .tex bytes with the universal newlines a text-mode read applies"""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _to_format_template(template: str) -> str:
+    """Turn <PLACEHOLDER> tokens into str.format fields, escaping LaTeX braces"""
+    escaped = template.replace("{", "{{").replace("}", "}}")
+    return _PLACEHOLDER_RE.sub(
+        lambda m: "{" + m.group(0)[1:-1].lower() + "}", escaped
+    )
+
+
+def _walk_files(root: Path) -> Dict[str, Path]:
+    """Map every file under root to its path, keyed relative to root
+
+    Directory symlinks are followed (the posts' assets folders are links),
+    but a directory whose real path was already visited is skipped, which
+    also breaks symlink cycles. Hidden directories are not descended into.
+    """
+    files: Dict[str, Path] = {}
+    pending = [("", os.path.realpath(root))]
+    seen = {pending[0][1]}
+    while pending:
+        rel_dir, real_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir():
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_symlink():
+                            real_path = os.path.realpath(entry.path)
+                        else:
+                            real_path = os.path.join(real_dir, entry.name)
+                        if real_path not in seen:
+                            seen.add(real_path)
+                            pending.append((rel_path, real_path))
+                    elif entry.is_file():
+                        files[rel_path] = Path(entry.path)
+        except OSError:
+            continue
+    return files
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos"""
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _strip_run_hrefs(text: str) -> str:
+    """Remove every \\href{run:...}{...} title line and its trailing whitespace"""
+    marker = "\\href{run:"
+    pos = text.find(marker)
+    if pos == -1:
+        return text
+
+    parts = []
+    last = 0
+    while pos != -1:
+        # Both groups must be non-empty and directly adjacent: {run:X}{Y}
+        target_end = text.find("}", pos + len(marker))
+        if (
+            target_end > pos + len(marker)
+            and text.startswith("{", target_end + 1)
+            and text.find("}", target_end + 2) > target_end + 2
+        ):
+            label_end = text.index("}", target_end + 2)
+            parts.append(text[last:pos])
+            last = _skip_whitespace(text, label_end + 1)
+            pos = text.find(marker, last)
+        else:
+            pos = text.find(marker, pos + 1)
+
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _strip_empty_sections(text: str) -> str:
+    """Remove every \\section{} with an empty or blank title"""
+    marker = "\\section{"
+    pos = text.find(marker)
+    if pos == -1:
+        return text
+
+    parts = []
+    last = 0
+    while pos != -1:
+        close = _skip_whitespace(text, pos + len(marker))
+        if text.startswith("}", close):
+            parts.append(text[last:pos])
+            last = _skip_whitespace(text, close + 1)
+            pos = text.find(marker, last)
+        else:
+            pos = text.find(marker, pos + 1)
+
+    parts.append(text[last:])
+    return "".join(parts)
 
 
 class Tex2TexConverter:
     """LaTeX to LaTeX converter with template application"""
 
-    def __init__(self, verbose: bool = False):
+    # Config and template shared by every instance, loaded on first use
+    _cached_config: Optional[Dict[str, Any]] = None
+    _cached_template: Optional[str] = None
+
+    def __init__(self, verbose: bool = False, preserve_metadata: bool = False):
         self.verbose = verbose
+        self.preserve_metadata = preserve_metadata
         self.config = self._load_config()
         self.template = self._load_template()
 
+        # Split once where entry content goes: before the bibliography, or
+        # before \end{document} if the template has none
+        insert_at = self.template.find("\\bibliographystyle")
+        if insert_at == -1:
+            insert_at = self.template.find("\\end{document}")
+        self._template_head = self.template[:insert_at]
+        self._template_tail = self.template[insert_at:]
+
+        # Templates rendered per file, converted to str.format skeletons once
+        self._template_fmts: Dict[str, str] = {
+            template: _to_format_template(template)
+            for template in (self.template, self._template_head, self._template_tail)
+        }
+
+        # Files under the candidate asset roots of the folder being converted
+        self._asset_index: Dict[str, Path] = {}
+        self._asset_index_dir: Optional[Path] = None
+
     def log(self, message: str, level: str = "INFO"):
         """Logging with optional verbosity"""
         if self.verbose or level in ["ERROR", "WARNING"]:
@@ -37,11 +211,16 @@ class Tex2TexConverter:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config.yaml"""
+        cls = type(self)
+        if cls._cached_config is not None:
+            return cls._cached_config
+
         config_path = Path(__file__).parent / "config.yaml"
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             self.log(f"Loaded config from {config_path}")
+            cls._cached_config = config
             return config
         except Exception as e:
             self.log(f"Error loading config: {e}", "ERROR")
@@ -49,6 +228,10 @@ class Tex2TexConverter:
 
     def _load_template(self) -> str:
         """Load the entry template"""
+        cls = type(self)
+        if cls._cached_template is not None:
+            return cls._cached_template
+
         template_path = (
             Path(__file__).parent
             / "assets"
@@ -60,41 +243,56 @@ class Tex2TexConverter:
             with open(template_path, "r", encoding="utf-8") as f:
                 template = f.read()
             self.log(f"Loaded template from {template_path}")
+            cls._cached_template = template
             return template
         except Exception as e:
             self.log(f"Error loading template: {e}", "ERROR")
             return ""
 
+    def _read_tex(self, tex_file: Path) -> bytes:
+        """Read a .tex file into memory, undecoded"""
+        with open(tex_file, "rb", buffering=_IO_BUFFER_SIZE) as f:
+            return f.read()
+
     def find_tex_files(self, input_folder: Path) -> List[Path]:
         """Find all .tex files in the input folder"""
-        tex_files = list(input_folder.glob("*.tex"))
+        with os.scandir(input_folder) as entries:
+            tex_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".tex") and entry.is_file()
+            )
         self.log(f"Found {len(tex_files)} .tex files in {input_folder}")
         return tex_files
 
-    def extract_content(self, tex_file: Path) -> Optional[str]:
+    def extract_content(
+        self, tex_file: Path, raw: Optional[bytes] = None
+    ) -> Optional[str]:
         """Extract content between \begin{document} and \end{document}"""
         try:
-            with open(tex_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            if raw is None:
+                raw = self._read_tex(tex_file)
 
             # Find the document content
-            doc_start = content.find("\\begin{document}")
-            doc_end = content.find("\\end{document}")
+            doc_start = raw.find(b"\\begin{document}")
+            doc_end = raw.find(
+                b"\\end{document}", doc_start + len(b"\\begin{document}")
+            )
 
             if doc_start == -1 or doc_end == -1:
                 self.log(f"No document environment found in {tex_file.name}", "WARNING")
                 return None
 
-            # Extract content between document tags
-            doc_content = content[
-                doc_start + len("\\begin{document}") : doc_end
-            ].strip()
+            # Extract content between document tags, decoding only that slice
+            doc_content = _decode_tex(
+                raw[doc_start + len(b"\\begin{document}") : doc_end]
+            ).strip()
 
             # Remove the title line if it exists (the \href{run:...} line)
-            doc_content = re.sub(r"\\href\{run:[^}]+\}\{[^}]+\}\s*", "", doc_content)
+            doc_content = _strip_run_hrefs(doc_content)
 
             # Remove empty sections
-            doc_content = re.sub(r"\\section\{\s*\}\s*", "", doc_content)
+            doc_content = _strip_empty_sections(doc_content)
 
             self.log(f"Extracted content from {tex_file.name}")
             return doc_content
@@ -108,7 +306,7 @@ class Tex2TexConverter:
         filename = tex_file.stem
 
         # Try to extract date from filename (format: YYYY-MM-DD or similar)
-        date_match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", filename)
+        date_match = _DATE_RE.search(filename)
 
         if date_match:
             year, month, day = date_match.groups()
@@ -116,41 +314,27 @@ class Tex2TexConverter:
             day_num = int(day)
         else:
             # Use current date as fallback
-            now = datetime.now()
+            now = _today()
             year = str(now.year)
             month_num = now.month
             day_num = now.day
 
-        # Month names
-        month_names = [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-
         return {
             "year": year,
             "month": str(month_num),
             "day": str(day_num),
-            "month_name": month_names[month_num - 1],
+            "month_name": _MONTH_NAMES[month_num - 1],
             "day_number": str(day_num),
         }
 
     def inject_personal_info(
-        self, template: str, tex_file: Path, folder_name: str
+        self,
+        template: str,
+        tex_file: Path,
+        folder_name: str,
+        date_info: Dict[str, str],
     ) -> str:
         """Inject personal information and date into template"""
-        date_info = self.get_date_info(tex_file)
-
         # Personal information from config
         author = self.config.get("author", "Unknown Author")
         institution = self.config.get("institution", "Unknown Institution")
@@ -158,50 +342,84 @@ class Tex2TexConverter:
 
         # Replace placeholders in template
         replacements = {
-            "<YEAR>": date_info["year"],
-            "<MONTH>": date_info["month"],
-            "<DAY>": date_info["day"],
-            "<MONTH_NAME>": date_info["month_name"],
-            "<DAY_NUMBER>": date_info["day_number"],
-            "<AUTHOR>": author,
-            "<INSTITUTION>": institution,
-            "<DIARY_TITLE>": diary_title,
-            "<FILENAME>": tex_file.name,
+            "year": date_info["year"],
+            "month": date_info["month"],
+            "day": date_info["day"],
+            "month_name": date_info["month_name"],
+            "day_number": date_info["day_number"],
+            "author": author,
+            "institution": institution,
+            "diary_title": diary_title,
+            "filename": tex_file.name,
+            # Add folder name as tag
+            "tags": folder_name,
         }
 
-        result = template
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-
-        # Add folder name as tag
-        if "<TAGS>" in result:
-            result = result.replace("<TAGS>", folder_name)
-        else:
-            # Add tags section if not present
-            result = result.replace("%<TAGs>: <TAGS>", f"%<TAGs>: {folder_name}")
+        # The entry template is converted once at startup; render it in one pass
+        template_fmt = self._template_fmts.get(template)
+        if template_fmt is None:
+            template_fmt = _to_format_template(template)
+        result = template_fmt.format_map(replacements)
 
         return result
 
     def copy_assets(
-        self, tex_file: Path, output_dir: Path, use_symlinks: bool = False
+        self,
+        tex_file: Path,
+        output_dir: Path,
+        use_symlinks: bool = False,
+        raw: Optional[bytes] = None,
     ) -> List[Path]:
         """Copy or symlink assets referenced in the LaTeX file"""
-        copied_files = []
+        assets = self.collect_assets(tex_file, output_dir, raw)
+        copied_files, failures = self.install_assets(
+            assets, tex_file.parent, output_dir, use_symlinks
+        )
+        for dest_file, error in failures.items():
+            self.log(f"Failed to copy asset {dest_file}: {error}", "ERROR")
+        return copied_files
+
+    def collect_assets(
+        self, tex_file: Path, output_dir: Path, raw: Optional[bytes] = None
+    ) -> Dict[Path, Tuple[str, Path]]:
+        """Map each referenced asset's destination to (reference, tex file)
 
+        Sources are resolved only when an asset is actually copied.
+        """
         # Find all asset references in the tex file
-        asset_refs = self._find_asset_references(tex_file)
+        asset_refs = self._find_asset_references(tex_file, raw)
+        if asset_refs:
+            self.log(f"Found {len(asset_refs)} asset references")
 
-        if not asset_refs:
-            self.log("No asset references found")
-            return copied_files
+        # Preserve the relative path structure from the tex file
+        return {
+            output_dir / asset_path: (asset_path, tex_file) for asset_path in asset_refs
+        }
 
-        self.log(f"Found {len(asset_refs)} asset references")
+    def install_assets(
+        self,
+        assets: Dict[Path, Tuple[str, Path]],
+        source_dir: Path,
+        output_dir: Path,
+        use_symlinks: bool = False,
+    ) -> Tuple[List[Path], Dict[Path, OSError]]:
+        """Copy or symlink collected assets, once per destination
+
+        A failed copy does not stop the batch; it is returned keyed by its
+        destination so callers can charge it to the files referencing it.
+        """
+        copied_files = []
+        failures: Dict[Path, OSError] = {}
+
+        if not assets:
+            self.log("No asset references found")
+            return copied_files, failures
 
         if use_symlinks:
             # Create a single symlink to the entire assets directory
             try:
                 # Find the root assets directory
-                root_dir = tex_file.parent
+                root_dir = source_dir
                 while root_dir.parent != root_dir:  # Not at filesystem root
                     if (root_dir / "assets").exists():
                         break
@@ -211,11 +429,8 @@ class Tex2TexConverter:
                 if original_assets_dir.exists():
                     # Create symlink to the entire assets directory
                     assets_symlink = output_dir / "assets"
-                    if assets_symlink.exists() or assets_symlink.is_symlink():
-                        assets_symlink.unlink()
-
                     relative_assets = os.path.relpath(original_assets_dir, output_dir)
-                    assets_symlink.symlink_to(relative_assets)
+                    self._ensure_symlink(assets_symlink, relative_assets)
                     self.log(f"Created assets symlink: assets -> {relative_assets}")
                     copied_files.append(assets_symlink)
                 else:
@@ -223,50 +438,81 @@ class Tex2TexConverter:
             except OSError as e:
                 self.log(f"Failed to create assets symlink: {e}", "WARNING")
                 # Fallback to copying individual files
-                for asset_path in asset_refs:
+                for dest_file, (asset_path, tex_file) in assets.items():
                     source_file = self._resolve_asset_path(asset_path, tex_file)
-                    if source_file and source_file.exists():
-                        dest_file = output_dir / asset_path
-                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_file, dest_file)
-                        copied_files.append(dest_file)
+                    if source_file:
+                        try:
+                            dest_file.parent.mkdir(parents=True, exist_ok=True)
+                            copied_file = self._copy_asset(source_file, dest_file)
+                        except OSError as copy_error:
+                            failures[dest_file] = copy_error
+                            continue
+                        copied_files.append(copied_file)
                         self.log(f"Fallback: Copied asset: {asset_path}")
         else:
             # Copy each referenced asset, preserving relative directory structure
-            for asset_path in asset_refs:
+            for dest_file, (asset_path, tex_file) in assets.items():
                 source_file = self._resolve_asset_path(asset_path, tex_file)
-                if source_file and source_file.exists():
-                    # Preserve the relative path structure from the tex file
-                    dest_file = output_dir / asset_path
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-                    # Copy file normally
-                    shutil.copy2(source_file, dest_file)
-                    copied_files.append(dest_file)
+                if source_file:
+                    try:
+                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                        copied_files.append(self._copy_asset(source_file, dest_file))
+                    except OSError as e:
+                        failures[dest_file] = e
+                        continue
                     self.log(f"Copied asset: {asset_path}")
                 else:
                     self.log(f"Asset not found: {asset_path}", "WARNING")
 
-        return copied_files
+        return copied_files, failures
+
+    def _copy_asset(self, source_file: Path, dest_file: Path) -> Path:
+        """Copy an asset's bytes, plus its metadata if requested
+
+        Like shutil.copy2, a destination that is a directory receives the
+        file under its own name. Returns the path actually written.
+        """
+        if self.preserve_metadata:
+            return Path(shutil.copy2(source_file, dest_file))
+
+        if os.path.isdir(dest_file):
+            dest_file = dest_file / source_file.name
+        # copyfile skips stat/utime/chmod and uses sendfile where available
+        return Path(shutil.copyfile(source_file, dest_file))
 
-    def _find_asset_references(self, tex_file: Path) -> List[str]:
+    def _ensure_symlink(self, link: Path, target: str):
+        """Point link at target, keeping an existing link that already does"""
+        if link.is_symlink() and os.readlink(link) == target:
+            return
+
+        if link.exists() or link.is_symlink():
+            link.unlink(missing_ok=True)
+
+        try:
+            link.symlink_to(target)
+        except FileExistsError:
+            # Another process created the same link in the meantime
+            if not (link.is_symlink() and os.readlink(link) == target):
+                raise
+
+    def _find_asset_references(
+        self, tex_file: Path, raw: Optional[bytes] = None
+    ) -> List[str]:
         """Find all asset references in the LaTeX file"""
         try:
-            with open(tex_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Find various asset reference patterns
-            patterns = [
-                r"\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}",
-                r"\\input\{([^}]*\.(?:png|jpg|jpeg|pdf|eps|svg))\}",
-                r"\\epsfig\{file=([^,}]+)",
-                r"\\psfig\{file=([^,}]+)",
-            ]
-
-            asset_refs = set()
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                asset_refs.update(matches)
+            if raw is None:
+                raw = self._read_tex(tex_file)
+
+            # Most entries have no figures; skip the regex scan for them
+            if not any(marker in raw for marker in _ASSET_MARKERS):
+                return []
+
+            # Find various asset reference patterns in a single pass
+            # A dict dedupes while keeping references in document order
+            asset_refs: Dict[str, None] = {}
+            for m in _ASSET_RE.finditer(raw):
+                ref = m.group("g") or m.group("i") or m.group("e") or m.group("p")
+                asset_refs[_decode_tex(ref)] = None
 
             return list(asset_refs)
 
@@ -274,14 +520,49 @@ class Tex2TexConverter:
             self.log(f"Error finding asset references: {e}", "ERROR")
             return []
 
+    def _asset_roots(self, tex_dir: Path) -> List[Path]:
+        """Directories searched for assets, in priority order"""
+        return [
+            tex_dir,
+            tex_dir / "assets" / "figures",
+            tex_dir / "figures",
+            tex_dir.parent / "assets" / "figures",
+        ]
+
+    def _build_asset_index(self, tex_dir: Path):
+        """Index the files under every asset root of tex_dir
+
+        The tex directory is walked once; the roots nested inside it are
+        re-keyed from that walk rather than walked again.
+        """
+        local_files = _walk_files(tex_dir)
+        index = dict(local_files)
+        for nested in (os.path.join("assets", "figures"), "figures"):
+            prefix = nested + os.sep
+            for rel_path, path in local_files.items():
+                if rel_path.startswith(prefix):
+                    index.setdefault(rel_path[len(prefix) :], path)
+
+        shared_figures = _walk_files(tex_dir.parent / "assets" / "figures")
+        for rel_path, path in shared_figures.items():
+            index.setdefault(rel_path, path)
+
+        self._asset_index = index
+        self._asset_index_dir = tex_dir
+        self.log(f"Indexed {len(index)} candidate asset files")
+
     def _resolve_asset_path(self, asset_path: str, tex_file: Path) -> Optional[Path]:
         """Resolve an asset path relative to the tex file"""
+        # Index the folder on its first lookup; misses still probe the disk
+        if tex_file.parent != self._asset_index_dir:
+            self._build_asset_index(tex_file.parent)
+        indexed = self._asset_index.get(os.path.normpath(asset_path))
+        if indexed is not None:
+            return indexed
+
         # Try different possible locations
         possible_paths = [
-            tex_file.parent / asset_path,
-            tex_file.parent / "assets" / "figures" / asset_path,
-            tex_file.parent / "figures" / asset_path,
-            tex_file.parent.parent / "assets" / "figures" / asset_path,
+            root / asset_path for root in self._asset_roots(tex_file.parent)
         ]
 
         for path in possible_paths:
@@ -298,48 +579,70 @@ class Tex2TexConverter:
         use_symlinks: bool = False,
     ) -> bool:
         """Convert a single .tex file"""
+        assets = self._convert_entry(tex_file, output_dir, folder_name)
+        if assets is None:
+            return False
+
         try:
+            # Copy or symlink assets
+            if use_symlinks:
+                self.log(f"Creating symlinks to assets for {tex_file.name}...")
+            else:
+                self.log(f"Copying assets for {tex_file.name}...")
+            _, failures = self.install_assets(
+                assets, tex_file.parent, output_dir, use_symlinks
+            )
+            for error in failures.values():
+                self.log(f"❌ Error converting {tex_file.name}: {error}", "ERROR")
+            return not failures
+
+        except Exception as e:
+            self.log(f"❌ Error converting {tex_file.name}: {e}", "ERROR")
+            return False
+
+    def _convert_entry(
+        self, tex_file: Path, output_dir: Path, folder_name: str
+    ) -> Optional[Dict[Path, Tuple[str, Path]]]:
+        """Write the converted .tex file and return the assets it needs
+
+        Returns None if the conversion failed.
+        """
+        try:
+            # Read the original file once and share it with the asset scan
+            raw = self._read_tex(tex_file)
+
             # Extract content from original file
-            content = self.extract_content(tex_file)
+            content = self.extract_content(tex_file, raw)
             if content is None:
-                return False
-
-            # Get template with personal info injected
-            template = self.inject_personal_info(self.template, tex_file, folder_name)
+                return None
 
-            # Find where to insert the content (after the title line)
-            title_line = f"\\href{{run:{tex_file.name}}}{{\\Huge {self.get_date_info(tex_file)['month_name']} {self.get_date_info(tex_file)['day_number']}}}"
+            # Get template halves with personal info injected
+            date_info = self.get_date_info(tex_file)
+            head = self.inject_personal_info(
+                self._template_head, tex_file, folder_name, date_info
+            )
+            tail = self.inject_personal_info(
+                self._template_tail, tex_file, folder_name, date_info
+            )
 
             # Insert content after the title line and before bibliography
-            if "\\bibliographystyle" in template:
-                # Insert content before bibliography
-                bib_start = template.find("\\bibliographystyle")
-                new_content = (
-                    template[:bib_start] + content + "\n\n" + template[bib_start:]
-                )
-            else:
-                # Insert content before \end{document}
-                doc_end = template.find("\\end{document}")
-                new_content = template[:doc_end] + content + "\n\n" + template[doc_end:]
+            new_content = "".join([head, content, "\n\n", tail])
 
-            # Write converted file
+            # Write converted file, encoded up front as a single write, with
+            # the platform line endings a text-mode write would produce
+            if os.linesep != "\n":
+                new_content = new_content.replace("\n", os.linesep)
             output_file = output_dir / tex_file.name
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            output_file.write_bytes(new_content.encode("utf-8"))
 
-            # Copy or symlink assets
-            if use_symlinks:
-                self.log(f"Creating symlinks to assets for {tex_file.name}...")
-            else:
-                self.log(f"Copying assets for {tex_file.name}...")
-            self.copy_assets(tex_file, output_dir, use_symlinks)
+            assets = self.collect_assets(tex_file, output_dir, raw=raw)
 
             self.log(f"✅ Converted {tex_file.name}")
-            return True
+            return assets
 
         except Exception as e:
             self.log(f"❌ Error converting {tex_file.name}: {e}", "ERROR")
-            return False
+            return None
 
     def convert_folder(
         self,
@@ -368,15 +671,52 @@ class Tex2TexConverter:
         # Get folder name for tagging
         folder_name = input_folder.name
 
-        # Convert each file
-        successful = 0
-        failed = 0
+        # Asset sources are indexed afresh, on the first lookup of this run
+        self._asset_index_dir = None
 
-        for tex_file in tex_files:
-            if self.convert_file(tex_file, output_folder, folder_name, use_symlinks):
-                successful += 1
-            else:
-                failed += 1
+        # Convert each file; files are independent, so spread them over processes
+        jobs = [(tex_file, output_folder, folder_name) for tex_file in tex_files]
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+
+        if max_workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                results = list(executor.map(_convert_one, jobs))
+        else:
+            results = [self._convert_entry(*job) for job in jobs]
+
+        failed_files = {
+            tex_file for tex_file, result in zip(tex_files, results) if result is None
+        }
+
+        # Merge per-file assets so figures shared between entries are copied
+        # once, remembering which files need each destination
+        assets: Dict[Path, Tuple[str, Path]] = {}
+        referenced_by: Dict[Path, List[Path]] = {}
+        for tex_file, result in zip(tex_files, results):
+            for dest_file, asset_ref in (result or {}).items():
+                assets.setdefault(dest_file, asset_ref)
+                referenced_by.setdefault(dest_file, []).append(tex_file)
+
+        if use_symlinks:
+            self.log("Creating symlinks to assets...")
+        else:
+            self.log("Copying assets...")
+        _, failures = self.install_assets(
+            assets, input_folder, output_folder, use_symlinks
+        )
+
+        # A failed copy fails every entry that references it
+        for dest_file, error in failures.items():
+            for tex_file in referenced_by[dest_file]:
+                self.log(f"❌ Error converting {tex_file.name}: {error}", "ERROR")
+                failed_files.add(tex_file)
+
+        failed = len(failed_files)
+        successful = len(results) - failed
 
         # Summary
         self.log(f"\n📊 Conversion Summary:")
@@ -387,6 +727,23 @@ class Tex2TexConverter:
         return failed
 
 
+# Converter used by each worker process, installed once by _init_worker
+_worker_converter: Optional[Tex2TexConverter] = None
+
+
+def _init_worker(converter: Tex2TexConverter):
+    """Install the converter shipped from the parent process"""
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_one(
+    job: Tuple[Path, Path, str]
+) -> Optional[Dict[Path, Tuple[str, Path]]]:
+    """Convert a single file inside a worker process"""
+    return _worker_converter._convert_entry(*job)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -415,6 +772,11 @@ Examples:
         action="store_true",
         help="Create symlinks to assets instead of copying",
     )
+    parser.add_argument(
+        "--preserve-metadata",
+        action="store_true",
+        help="Preserve timestamps and permissions of copied assets",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -429,7 +791,9 @@ Examples:
         sys.exit(1)
 
     # Create converter and convert
-    converter = Tex2TexConverter(verbose=args.verbose)
+    converter = Tex2TexConverter(
+        verbose=args.verbose, preserve_metadata=args.preserve_metadata
+    )
 
     try:
         failed_count = converter.convert_folder(